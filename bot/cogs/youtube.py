@@ -3,15 +3,22 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
+import logging
 import re
+import time
 
 import discord
 import httpx
 from discord import app_commands
 from discord.ext import commands
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from ..config import settings
 
+logger = logging.getLogger("youtube-storage-bot.youtube")
+
 # Step progress indicators
 STEP_EMOJIS = {
     0: "⏳",  # Pending
@@ -21,14 +28,35 @@ STEP_EMOJIS = {
     4: "🌐",  # Web archive
 }
 
+STATUS_DISPLAY = {
+    "pending": "⏳ Pending",
+    "running": "🔄 Processing",
+    "completed": "✅ Completed",
+    "failed": "❌ Failed",
+}
+
+# Progress bars precomputed for each step value (0-4)
+_PROGRESS_BARS = tuple(
+    " ".join("✅" if i < step else "🔄" if i == step else "⬜" for i in range(1, 5))
+    for step in range(5)
+)
+
+_STATUS_COLOR = {
+    "completed": discord.Color.green(),
+    "failed": discord.Color.red(),
+}
 
+
+_YT_URL_RE = re.compile(r"(?:https?://)?(?:www\.)?(?:youtube\.com/watch\?v=|youtu\.be/)[\w-]+")
+
+
+@functools.lru_cache(maxsize=1024)
 def is_youtube_url(url: str) -> bool:
-    """Check if URL is a valid YouTube URL."""
-    patterns = [
-        r"(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+",
-        r"(?:https?://)?(?:www\.)?youtu\.be/[\w-]+",
-    ]
-    return any(re.match(p, url) for p in patterns)
+    """Check if URL is a valid YouTube URL.
+
+    Memoized so repeat submissions of the same URL skip the regex match.
+    """
+    return _YT_URL_RE.match(url) is not None
 
 
 def create_progress_embed(job: dict, processing: bool = True) -> discord.Embed:
@@ -38,12 +66,7 @@ def create_progress_embed(job: dict, processing: bool = True) -> discord.Embed:
     step_name = job["step_name"]
 
     # Determine color
-    if status == "completed":
-        color = discord.Color.green()
-    elif status == "failed":
-        color = discord.Color.red()
-    else:
-        color = discord.Color.blue()
+    color = _STATUS_COLOR.get(status, discord.Color.blue())
 
     embed = discord.Embed(
         title="🎥 YouTube Video Processing",
@@ -58,29 +81,15 @@ def create_progress_embed(job: dict, processing: bool = True) -> discord.Embed:
     )
 
     # Status
-    status_display = {
-        "pending": "⏳ Pending",
-        "running": "🔄 Processing",
-        "completed": "✅ Completed",
-        "failed": "❌ Failed",
-    }
     embed.add_field(
         name="Status",
-        value=status_display.get(status, status),
+        value=STATUS_DISPLAY.get(status, status),
         inline=True,
     )
 
     # Progress bar
     if processing or status == "running":
-        progress_parts = []
-        for i in range(1, 5):
-            if i < step:
-                progress_parts.append("✅")
-            elif i == step:
-                progress_parts.append("🔄")
-            else:
-                progress_parts.append("⬜")
-        progress_bar = " ".join(progress_parts)
+        progress_bar = _PROGRESS_BARS[step] if 0 <= step < len(_PROGRESS_BARS) else _PROGRESS_BARS[0]
         embed.add_field(
             name="Progress",
             value=f"{progress_bar}\n{STEP_EMOJIS.get(step, '⏳')} {step_name}",
@@ -118,9 +127,27 @@ def create_progress_embed(job: dict, processing: bool = True) -> discord.Embed:
 class YouTubeCog(commands.Cog):
     """YouTube processing commands."""
 
+    # How long the jobs-list cache stays fresh
+    JOBS_CACHE_TTL = 5.0  # seconds
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.http = httpx.AsyncClient(base_url=settings.api_base_url, timeout=30.0)
+        # Shared client with HTTP/2 and a tuned keep-alive pool so the
+        # high-frequency polling/streaming paths reuse connections
+        self.http = httpx.AsyncClient(
+            base_url=settings.api_base_url,
+            timeout=30.0,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(
+                    max_keepalive_connections=32,
+                    max_connections=64,
+                    keepalive_expiry=60.0,
+                ),
+            ),
+        )
+        self._jobs_cache: tuple[float, list[dict]] | None = None
 
     async def cog_unload(self):
         await self.http.aclose()
@@ -155,6 +182,9 @@ class YouTubeCog(commands.Cog):
             data = response.json()
             job_id = data["job_id"]
 
+            # Invalidate the jobs-list cache so the new job shows up immediately
+            self._jobs_cache = None
+
             # Get initial job status
             job_response = await self.http.get(f"/api/jobs/{job_id}")
             job = job_response.json()
@@ -163,37 +193,126 @@ class YouTubeCog(commands.Cog):
             embed = create_progress_embed(job)
             message = await interaction.followup.send(embed=embed)
 
-            # Poll for updates
-            await self._poll_job_status(message, job_id)
+            # Track progress until the job finishes
+            await self._track_job(message, job_id)
 
         except httpx.HTTPError as e:
             await interaction.followup.send(f"❌ API 오류: {e}")
         except Exception as e:
             await interaction.followup.send(f"❌ 오류 발생: {e}")
 
+    async def _track_job(self, message: discord.Message, job_id: str):
+        """Follow job progress, preferring server-pushed events over polling."""
+        try:
+            streamed = await self._stream_job_events(message, job_id)
+        except httpx.HTTPError:
+            streamed = False
+        if not streamed:
+            await self._poll_job_status(message, job_id)
+
+    async def _stream_job_events(self, message: discord.Message, job_id: str) -> bool:
+        """Consume the SSE job-event stream and update the message.
+
+        Returns False if the server doesn't expose the events endpoint, so the
+        caller can fall back to polling.
+        """
+        last_state = None
+        event_name = ""
+
+        async with self.http.stream("GET", f"/api/jobs/{job_id}/events", timeout=None) as response:
+            if response.status_code != 200:
+                return False
+
+            async for line in response.aiter_lines():
+                if not line:
+                    event_name = ""  # frame boundary resets the event type
+                    continue
+                if line.startswith("event: "):
+                    event_name = line[len("event: "):].strip()
+                    continue
+                if not line.startswith("data: "):
+                    continue
+                # Only state frames carry the job record; log frames are for
+                # other consumers (web UI, CLI tails)
+                if event_name not in ("", "state"):
+                    continue
+                job = json.loads(line[len("data: "):])
+
+                # Only edit the message on actual transitions (heartbeats repeat state)
+                state = (job["status"], job["current_step"])
+                if state != last_state:
+                    last_state = state
+                    embed = create_progress_embed(job, processing=job["status"] == "running")
+                    await message.edit(embed=embed)
+
+                if job["status"] in ("completed", "failed"):
+                    break
+
+        return True
+
     async def _poll_job_status(self, message: discord.Message, job_id: str):
-        """Poll job status and update message."""
-        poll_interval = 5  # seconds
-        max_polls = 720  # 1 hour max
+        """Poll job status and update message.
+
+        Uses exponential backoff: the interval starts short and doubles while
+        the job sits in the same step, resetting whenever progress is made, so
+        long-running steps (burn-in, upload) don't hammer the API or Discord.
+        """
+        base_interval = 2  # seconds
+        max_interval = 60  # seconds
+        max_duration = 3600  # 1 hour max
+        max_error_streak = 10
 
-        for _ in range(max_polls):
-            await asyncio.sleep(poll_interval)
+        interval = base_interval
+        last_state = None
+        error_streak = 0
+        deadline = asyncio.get_running_loop().time() + max_duration
+
+        while asyncio.get_running_loop().time() < deadline:
+            await asyncio.sleep(interval)
 
             try:
-                response = await self.http.get(f"/api/jobs/{job_id}")
+                # Retry transient HTTP errors quickly instead of waiting a
+                # full poll interval; real bugs propagate to the caller
+                async for attempt in AsyncRetrying(
+                    stop=stop_after_attempt(3),
+                    wait=wait_exponential(multiplier=1, max=30),
+                    retry=retry_if_exception_type(httpx.HTTPError),
+                    reraise=True,
+                ):
+                    with attempt:
+                        response = await self.http.get(f"/api/jobs/{job_id}")
+
                 job = response.json()
+                error_streak = 0
 
-                # Update embed
-                embed = create_progress_embed(job, processing=job["status"] == "running")
-                await message.edit(embed=embed)
+                # Back off while nothing changes, reset on progress
+                state = (job["status"], job["current_step"], job.get("step_name"))
+                if state == last_state:
+                    interval = min(interval * 2, max_interval)
+                else:
+                    interval = base_interval
+
+                done = job["status"] in ("completed", "failed")
+
+                # Skip the Discord edit when nothing changed; always render
+                # the terminal state so final results show up
+                if state != last_state or done:
+                    embed = create_progress_embed(job, processing=job["status"] == "running")
+                    await message.edit(embed=embed)
+
+                last_state = state
 
                 # Stop polling if job is done
-                if job["status"] in ("completed", "failed"):
+                if done:
                     break
 
-            except Exception:
-                # Continue polling on error
-                continue
+            except httpx.HTTPError as e:
+                # Retries exhausted — back off and give up after a long streak
+                logger.warning("Polling job %s failed: %s", job_id, e)
+                error_streak += 1
+                if error_streak >= max_error_streak:
+                    break
+                interval = min(interval * 2, max_interval)
 
     @app_commands.command(name="status", description="Check job status")
     @app_commands.describe(job_id="Job ID to check")
@@ -220,16 +339,27 @@ class YouTubeCog(commands.Cog):
         await interaction.response.defer()
 
         try:
-            response = await self.http.get("/api/jobs")
-            jobs = response.json()
+            # Serve repeat queries from a short-lived cache
+            if self._jobs_cache and time.monotonic() - self._jobs_cache[0] < self.JOBS_CACHE_TTL:
+                jobs = self._jobs_cache[1]
+            else:
+                # Ask the API for the 10 most recent jobs, projected down to
+                # the fields the embed actually renders
+                response = await self.http.get(
+                    "/api/jobs",
+                    params={
+                        "limit": 10,
+                        "order": "-started_at",
+                        "fields": "id,video_id,status,started_at",
+                    },
+                )
+                jobs = response.json()
+                self._jobs_cache = (time.monotonic(), jobs)
 
             if not jobs:
                 await interaction.followup.send("📋 처리된 작업이 없습니다.")
                 return
 
-            # Show last 10 jobs
-            jobs = sorted(jobs, key=lambda j: j["started_at"], reverse=True)[:10]
-
             embed = discord.Embed(
                 title="📋 Recent Jobs",
                 color=discord.Color.blue(),
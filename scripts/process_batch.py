@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Batch driver for the YouTube video processing pipeline.
+
+Reads URLs (one per line, # comments allowed) and processes them in parallel
+across a multiprocessing pool, one process_video.py run per URL. The pool is
+sized so concurrent jobs don't oversubscribe the machine: by default
+cpu_count() // threads-per-job workers, where threads-per-job approximates the
+threads ffmpeg/whisper use per video.
+
+Usage:
+    python3 scripts/process_batch.py urls.txt
+    python3 scripts/process_batch.py urls.txt --jobs 2 --no-upload
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+PROCESS_SCRIPT = SCRIPT_DIR / "process_video.py"
+
+# Flags forwarded verbatim to every process_video.py invocation
+_forwarded_flags: list[str] = []
+
+
+def _init_worker(flags: list[str]) -> None:
+    global _forwarded_flags
+    _forwarded_flags = flags
+
+
+def process_one_url(url: str) -> tuple[str, int]:
+    """Run the full pipeline for one URL. Returns (url, exit code)."""
+    proc = subprocess.run(
+        [sys.executable, str(PROCESS_SCRIPT), url] + _forwarded_flags,
+    )
+    return url, proc.returncode
+
+
+def read_urls(path: Path) -> list[str]:
+    """Read URLs from a file, skipping blanks, comments, and duplicates."""
+    urls: list[str] = []
+    seen: set[str] = set()
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and line not in seen:
+            urls.append(line)
+            seen.add(line)
+    return urls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Process multiple YouTube videos in parallel across CPU cores."
+    )
+    parser.add_argument("urls_file", type=Path, help="File with one YouTube URL per line")
+    parser.add_argument("--jobs", type=int, help="Number of parallel jobs (default: auto)")
+    parser.add_argument(
+        "--threads-per-job", type=int, default=4,
+        help="Approximate threads each job uses, for auto pool sizing (default: 4)",
+    )
+    parser.add_argument("--keep-source", action="store_true", help="Keep source video files")
+    parser.add_argument("--no-upload", action="store_true", help="Skip YouTube upload")
+    parser.add_argument("--no-add-to-web", action="store_true", help="Skip adding to web archive")
+    parser.add_argument("--dry-run", action="store_true", help="Dry run (skip external API calls)")
+    args = parser.parse_args()
+
+    urls = read_urls(args.urls_file)
+    if not urls:
+        print(f"No URLs found in {args.urls_file}")
+        sys.exit(1)
+
+    jobs = args.jobs or max(1, multiprocessing.cpu_count() // max(1, args.threads_per_job))
+    jobs = min(jobs, len(urls))
+
+    flags = []
+    for flag in ("keep_source", "no_upload", "no_add_to_web", "dry_run"):
+        if getattr(args, flag):
+            flags.append("--" + flag.replace("_", "-"))
+
+    print(f"Processing {len(urls)} video(s) with {jobs} parallel job(s)")
+
+    failed: list[str] = []
+    with multiprocessing.Pool(processes=jobs, initializer=_init_worker, initargs=(flags,)) as pool:
+        for url, returncode in pool.imap_unordered(process_one_url, urls):
+            if returncode == 0:
+                print(f"[done] {url}")
+            else:
+                print(f"[FAILED:{returncode}] {url}")
+                failed.append(url)
+
+    print(f"\nCompleted: {len(urls) - len(failed)}/{len(urls)}")
+    if failed:
+        print("Failed URLs:")
+        for url in failed:
+            print(f"  - {url}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
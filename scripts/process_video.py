@@ -17,17 +17,28 @@ Note: Web archive curation is handled by Claude CLI with notes-to-archive skill.
 from __future__ import annotations
 
 import argparse
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
+import logging.handlers
+import mmap
 import os
+import queue
 import re
 import shutil
-import subprocess
 import sys
+import time
 import urllib.request
 from datetime import datetime
 from pathlib import Path
 
+try:  # Optional fast JSON; hot paths fall back to stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
 # Paths
 SCRIPT_DIR = Path(__file__).resolve().parent
 REPO_ROOT = SCRIPT_DIR.parent
@@ -41,6 +52,16 @@ TOKEN_PATH = OAUTH_DIR / "token.json"
 # Web repo path
 WEB_REPO_PATH = REPO_ROOT.parent / "web"
 
+# On-disk cache for yt-dlp lookups (URL → video ID, video ID → metadata)
+YTMETA_CACHE_DIR = REPO_ROOT / ".cache" / "ytmeta"
+YTMETA_CACHE_TTL = 86400  # 24 hours
+
+# Shared yt-dlp cache dir so the player/signature caches stay warm across
+# the multiple yt-dlp invocations of one job (ID lookup, metadata, and the
+# skills' internal downloads, which pick it up via $YTDLP_CACHE_DIR)
+YTDLP_CACHE_DIR = REPO_ROOT / ".cache" / "yt-dlp"
+os.environ.setdefault("YTDLP_CACHE_DIR", str(YTDLP_CACHE_DIR))
+
 # Skill script paths
 SUBS_SCRIPT = SKILLS_DIR / "yt-subs-whisper-translate" / "scripts" / "yt_subs_whisper_translate.py"
 BURNIN_SCRIPT = SKILLS_DIR / "yt-burnin-upload" / "scripts" / "yt_burnin_upload.py"
@@ -91,39 +112,123 @@ def send_discord_notification(message: str, video_id: str = "", error: str = "")
         return False
 
 
+# Active logging pipeline for this process; torn down and replaced on each
+# setup_logging call so repeat runs don't leak listener threads or file handles
+_log_listener: logging.handlers.QueueListener | None = None
+_log_handlers: list[logging.Handler] = []
+
+
+def _shutdown_logging() -> None:
+    """Stop the queue listener, flush batched records and close the handlers."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+    for handler in _log_handlers:
+        handler.close()
+    _log_handlers.clear()
+
+
+atexit.register(_shutdown_logging)
+
+
 def setup_logging(log_path: Path) -> logging.Logger:
     """Setup logging to both file and console."""
+    global _log_listener
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
     logger = logging.getLogger("process_video")
     logger.setLevel(logging.DEBUG)
-
-    # File handler
-    fh = logging.FileHandler(log_path, encoding="utf-8")
+    # Repeat invocations in one process (batch drivers, worker pool) must not
+    # stack handlers or leak the previous run's listener thread and log file:
+    # stop the old pipeline (flushing its batched records) before rebuilding
+    _shutdown_logging()
+    logger.handlers.clear()
+    logger.propagate = False
+
+    # File handler, batched: records accumulate in memory and hit the disk
+    # every 200 records (or immediately on WARNING+), cutting per-line write
+    # pressure from chatty subprocess output
+    fh = logging.FileHandler(log_path, encoding="utf-8", delay=True)
     fh.setLevel(logging.DEBUG)
     fh.setFormatter(logging.Formatter("%(asctime)s - %(levelname)s - %(message)s"))
+    mh = logging.handlers.MemoryHandler(capacity=200, flushLevel=logging.WARNING, target=fh)
+    mh.setLevel(logging.DEBUG)
 
     # Console handler
     ch = logging.StreamHandler()
     ch.setLevel(logging.INFO)
     ch.setFormatter(logging.Formatter("%(message)s"))
 
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+    # Run the real handlers on a background thread so hot logger calls (e.g.
+    # per-line subprocess output) just enqueue a record instead of waiting on
+    # file/terminal writes
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, mh, ch, respect_handler_level=True)
+    _log_listener.start()
+    # MemoryHandler first so its close() flushes into the file before it closes
+    _log_handlers.extend((mh, fh, ch))
 
     return logger
 
 
+def load_json(path: Path) -> dict:
+    """Parse a JSON file, using orjson when available."""
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def dump_json(obj) -> bytes:
+    """Serialize to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _cache_path(key: str) -> Path:
+    return YTMETA_CACHE_DIR / hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+
+def cache_get(key: str) -> bytes | None:
+    """Read a cached yt-dlp result, or None if missing or expired."""
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime < YTMETA_CACHE_TTL:
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def cache_set(key: str, data: bytes) -> None:
+    """Store a yt-dlp result in the on-disk cache."""
+    YTMETA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _cache_path(key).write_bytes(data)
+
+
+def detect_gpu() -> bool:
+    """Best-effort CUDA detection: an NVIDIA driver ships nvidia-smi."""
+    return shutil.which("nvidia-smi") is not None
+
+
+# Resolved executable paths; one $PATH walk per binary per process
+_EXE_CACHE: dict[str, str] = {}
+
+
 def require_exe(name: str) -> str:
-    """Check if executable exists in PATH."""
-    path = shutil.which(name)
-    if not path:
-        raise RuntimeError(f"Required executable not found: {name}")
+    """Check if executable exists in PATH (resolved once, then cached)."""
+    path = _EXE_CACHE.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if not path:
+            raise RuntimeError(f"Required executable not found: {name}")
+        _EXE_CACHE[name] = path
     return path
 
 
-def run_command(cmd: list[str], logger: logging.Logger, capture: bool = False, stream_output: bool = False) -> str:
-    """Run a command and log output.
+async def run_command(cmd: list[str], logger: logging.Logger, capture: bool = False, stream_output: bool = False) -> str:
+    """Run a command asynchronously and log output.
 
     Args:
         cmd: Command to run
@@ -134,66 +239,193 @@ def run_command(cmd: list[str], logger: logging.Logger, capture: bool = False, s
     logger.debug(f"Running: {' '.join(cmd)}")
 
     if capture:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, stderr = await proc.communicate()
         if proc.returncode != 0:
-            logger.error(f"Command failed: {proc.stderr}")
+            logger.error(f"Command failed: {stderr.decode('utf-8', errors='replace')}")
             raise RuntimeError(f"Command failed: {' '.join(cmd)}")
-        return proc.stdout
+        return stdout.decode("utf-8")
     elif stream_output:
         # Stream output to logger for detailed tracking
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1,
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
         )
         output_lines = []
-        for line in proc.stdout:
-            line = line.rstrip()
+
+        def handle_line(raw_line: bytes) -> None:
+            line = raw_line.decode("utf-8", errors="replace").rstrip()
             if line:
                 logger.info(f"  | {line}")
                 output_lines.append(line)
-        proc.wait()
+
+        # Read the pipe in large chunks and split lines ourselves — cheaper
+        # than per-line buffered reads, and immune to over-long lines
+        buf = bytearray()
+        while True:
+            chunk = await proc.stdout.read(65536)
+            if not chunk:
+                break
+            buf += chunk
+            *complete, rest = buf.split(b"\n")
+            buf = bytearray(rest)
+            for raw_line in complete:
+                handle_line(raw_line)
+        if buf:
+            handle_line(bytes(buf))
+
+        await proc.wait()
         if proc.returncode != 0:
             raise RuntimeError(f"Command failed with code {proc.returncode}")
         return "\n".join(output_lines)
     else:
-        proc = subprocess.run(cmd)
+        proc = await asyncio.create_subprocess_exec(*cmd)
+        await proc.wait()
         if proc.returncode != 0:
             raise RuntimeError(f"Command failed with code {proc.returncode}")
         return ""
 
 
-def get_video_id(url: str, logger: logging.Logger) -> str:
+# Fast path for standard YouTube URL forms; unusual URLs fall back to yt-dlp
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|/shorts/|/embed/|/live/)([0-9A-Za-z_-]{11})")
+
+# PR URL in Claude CLI output (same pattern job_runner uses)
+_PR_URL_RE = re.compile(r"https://github\.com/[^\s]+/pull/\d+")
+
+
+async def get_video_id(url: str, logger: logging.Logger, refresh: bool = False) -> str:
     """Extract video ID from YouTube URL."""
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        video_id = match.group(1)
+        logger.info(f"Video ID: {video_id}")
+        return video_id
+
+    # Unusual URL form — check the cache before paying for a yt-dlp run
+    if not refresh:
+        cached = cache_get(f"id:{url}")
+        if cached:
+            video_id = cached.decode("utf-8")
+            logger.info(f"Video ID (cached): {video_id}")
+            return video_id
+
     require_exe("yt-dlp")
-    out = run_command(
-        ["yt-dlp", "--no-playlist", "--quiet", "--no-warnings", "--print", "%(id)s", "--skip-download", url],
+    out = await run_command(
+        ["yt-dlp", "--no-playlist", "--quiet", "--no-warnings", "--cache-dir", str(YTDLP_CACHE_DIR),
+         "--print", "%(id)s", "--skip-download", url],
         logger,
         capture=True,
     )
     video_id = out.strip().splitlines()[-1].strip()
     if not video_id:
         raise RuntimeError("Failed to extract video ID")
+    cache_set(f"id:{url}", video_id.encode("utf-8"))
     logger.info(f"Video ID: {video_id}")
     return video_id
 
 
-def download_metadata(url: str, output_path: Path, logger: logging.Logger) -> dict:
-    """Download video metadata."""
+async def download_metadata(
+    url: str,
+    output_path: Path,
+    logger: logging.Logger,
+    video_id: str | None = None,
+    refresh: bool = False,
+) -> dict:
+    """Download video metadata, streaming yt-dlp's JSON straight to disk.
+
+    When `video_id` is given, the metadata dump is shared across runs through
+    the on-disk cache (24h TTL), so re-processing the same video into a
+    different output directory skips the yt-dlp round-trip entirely.
+    """
+    if video_id and not refresh:
+        cached = cache_get(f"meta:{video_id}")
+        if cached is not None:
+            output_path.write_bytes(cached)
+            logger.info(f"Metadata from cache: {output_path}")
+            return load_json(output_path)
+
     require_exe("yt-dlp")
-    out = run_command(
-        ["yt-dlp", "--no-playlist", "--quiet", "--no-warnings", "--dump-json", "--skip-download", url],
-        logger,
-        capture=True,
-    )
-    output_path.write_text(out, encoding="utf-8")
+    cmd = ["yt-dlp", "--no-playlist", "--quiet", "--no-warnings", "--cache-dir", str(YTDLP_CACHE_DIR),
+           "--dump-json", "--skip-download", url]
+    logger.debug(f"Running: {' '.join(cmd)}")
+
+    # Redirect stdout to the target file so the (often large) JSON dump never
+    # sits in a Python string
+    with output_path.open("wb") as out_file:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=out_file,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+
+    if proc.returncode != 0:
+        output_path.unlink(missing_ok=True)
+        logger.error(f"Command failed: {stderr.decode('utf-8', errors='replace')}")
+        raise RuntimeError(f"Command failed: {' '.join(cmd)}")
+
+    if video_id:
+        cache_set(f"meta:{video_id}", output_path.read_bytes())
+
     logger.info(f"Metadata saved: {output_path}")
-    return json.loads(out)
+    return load_json(output_path)
+
+
+def _find_source(out_dir: Path) -> Path | None:
+    """Locate the shared source.* download in the output directory."""
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.startswith("source."):
+                return Path(entry.path)
+    return None
+
+
+async def step_download(url: str, out_dir: Path, logger: logging.Logger, dry_run: bool = False) -> Path | None:
+    """Step 0: Download the source video once, shared by later steps.
+
+    The yt-subs and yt-burnin skills each download the video themselves when
+    no source is present; fetching it here once and pointing them at it (via
+    $YT_SOURCE_FILE) halves the network traffic per job. The resulting
+    source.* file is the same one cleanup_source removes at the end.
+    """
+    logger.info("=" * 50)
+    logger.info("Step 0: Downloading source video...")
+
+    existing = _find_source(out_dir)
+    if existing:
+        logger.info(f"Using existing source: {existing}")
+        return existing
+
+    if dry_run:
+        logger.info("[DRY RUN] Would download source video")
+        return None
+
+    require_exe("yt-dlp")
+    cmd = [
+        "yt-dlp", "--no-playlist", "--no-warnings", "--cache-dir", str(YTDLP_CACHE_DIR),
+        # Progress as discrete lines: without this yt-dlp redraws one line
+        # with \r and the \n-splitting reader in run_command would buffer the
+        # whole progress stream as a single giant line
+        "--newline",
+        "-f", "bestvideo+bestaudio/best",
+        "-o", str(out_dir / "source.%(ext)s"),
+        url,
+    ]
+    await run_command(cmd, logger, stream_output=True)
 
+    source = _find_source(out_dir)
+    if not source:
+        raise RuntimeError(f"Source video not downloaded into {out_dir}")
+    logger.info(f"Source video: {source}")
+    return source
 
-def step_subtitles(url: str, out_dir: Path, logger: logging.Logger, dry_run: bool = False) -> Path:
+
+async def step_subtitles(url: str, out_dir: Path, logger: logging.Logger, dry_run: bool = False) -> Path:
     """Step 1: Generate/translate subtitles."""
     logger.info("=" * 50)
     logger.info("Step 1: Generating subtitles...")
@@ -211,7 +443,7 @@ def step_subtitles(url: str, out_dir: Path, logger: logging.Logger, dry_run: boo
     if dry_run:
         cmd.append("--dry-run")
 
-    run_command(cmd, logger, stream_output=True)
+    await run_command(cmd, logger, stream_output=True)
 
     ko_srt = out_dir / "ko.srt"
     if not ko_srt.exists():
@@ -221,7 +453,7 @@ def step_subtitles(url: str, out_dir: Path, logger: logging.Logger, dry_run: boo
     return ko_srt
 
 
-def step_burnin(
+async def step_burnin(
     url: str,
     ko_srt: Path,
     en_srt: Path,
@@ -229,11 +461,13 @@ def step_burnin(
     logger: logging.Logger,
     dry_run: bool = False,
     upload: bool = False,
-) -> tuple[Path, str | None]:
+) -> tuple[Path, dict | None]:
     """Step 2: Burn in dual subtitles (Korean + English) and optionally upload to YouTube.
 
     Returns:
-        Tuple of (burnin_mp4_path, upload_url or None)
+        Tuple of (burnin_mp4_path, parsed upload_info dict or None). The dict
+        is handed back to the caller so upload_info.json is parsed exactly
+        once per run.
     """
     logger.info("=" * 50)
     if upload:
@@ -265,43 +499,39 @@ def step_burnin(
     if dry_run:
         cmd.append("--dry-run")
 
-    run_command(cmd, logger, stream_output=True)
+    await run_command(cmd, logger, stream_output=True)
 
     burnin_mp4 = out_dir / "burnin.mp4"
     if not dry_run and not burnin_mp4.exists():
         raise RuntimeError(f"Burn-in video not generated: {burnin_mp4}")
 
     # Check for upload info (created by yt-burnin-upload skill)
-    upload_url = None
+    upload_info = None
     upload_info_path = out_dir / "upload_info.json"
     if upload and upload_info_path.exists():
         try:
-            upload_info = json.loads(upload_info_path.read_text(encoding="utf-8"))
-            upload_url = upload_info.get("url")
-            logger.info(f"Uploaded: {upload_url}")
+            upload_info = load_json(upload_info_path)
+            logger.info(f"Uploaded: {upload_info.get('url')}")
         except Exception:
-            pass
+            upload_info = None
 
     logger.info(f"Burn-in video: {burnin_mp4}")
-    return burnin_mp4, upload_url
+    return burnin_mp4, upload_info
 
 
-def step_markdown(ko_srt: Path, out_dir: Path, title: str, description: str, logger: logging.Logger, dry_run: bool = False) -> Path:
+async def step_markdown(ko_srt: Path, out_dir: Path, title: str, description: str, meta: dict, logger: logging.Logger, dry_run: bool = False) -> Path:
     """Step 3: Generate markdown notes."""
     logger.info("=" * 50)
     logger.info("Step 3: Generating markdown notes...")
 
     notes_md = out_dir / "notes.md"
 
-    # Check for chapters in metadata
-    meta_path = out_dir / "meta.json"
+    # Check for chapters in the already-decoded metadata
     chapters_arg = []
-    if meta_path.exists():
-        meta = json.loads(meta_path.read_text(encoding="utf-8"))
-        if meta.get("chapters"):
-            chapters_path = out_dir / "chapters.json"
-            chapters_path.write_text(json.dumps(meta["chapters"]), encoding="utf-8")
-            chapters_arg = ["--chapters", str(chapters_path)]
+    if meta.get("chapters"):
+        chapters_path = out_dir / "chapters.json"
+        chapters_path.write_bytes(dump_json(meta["chapters"]))
+        chapters_arg = ["--chapters", str(chapters_path)]
 
     cmd = [
         sys.executable,
@@ -309,13 +539,13 @@ def step_markdown(ko_srt: Path, out_dir: Path, title: str, description: str, log
         "--input", str(ko_srt),
         "--output", str(notes_md),
         "--title", title,
-        "--description", description[:500] if description else "",
+        "--description", description,
     ] + chapters_arg
 
     if dry_run:
         cmd.append("--dry-run")
 
-    run_command(cmd, logger, stream_output=True)
+    await run_command(cmd, logger, stream_output=True)
 
     if not dry_run and not notes_md.exists():
         raise RuntimeError(f"Markdown notes not generated: {notes_md}")
@@ -325,31 +555,92 @@ def step_markdown(ko_srt: Path, out_dir: Path, title: str, description: str, log
 
 
 def cleanup_source(out_dir: Path, logger: logging.Logger) -> None:
-    """Remove source video to save space."""
-    source_files = list(out_dir.glob("source.*"))
-    for f in source_files:
-        logger.info(f"Removing source file: {f}")
-        f.unlink()
+    """Remove the shared source.* video to save space.
+
+    source.* is the contract between step_download and the skills: whichever
+    step fetched the video leaves it under this name, and it's deleted here
+    unless --keep-source was given.
+    """
+    with os.scandir(out_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.startswith("source."):
+                logger.info(f"Removing source file: {entry.path}")
+                os.unlink(entry.path)
+
+
+# Reverse index over the archive: video ID → archive filename. Rebuilt from
+# a full scan whenever it's missing or older than the archive directory
+# (i.e. files were added/removed since, e.g. by Claude or a git pull).
+# Kept under this repo's .cache/ — never inside the web repo's working tree,
+# where an untracked dotfile could ride along into archive PRs
+_ARCHIVE_INDEX_DIR = REPO_ROOT / ".cache" / "archive-index"
+_ARCHIVE_ID_RE = re.compile(rb'originalVideoId: "([^"]+)"')
+
+
+def _archive_index_path(archive_dir: Path) -> Path:
+    key = hashlib.sha256(str(archive_dir).encode("utf-8")).hexdigest()[:24]
+    return _ARCHIVE_INDEX_DIR / f"{key}.json"
+
+
+def _load_archive_index(archive_dir: Path) -> dict[str, str] | None:
+    """Read the persisted index, or None if it's missing, stale or corrupt."""
+    index_path = _archive_index_path(archive_dir)
+    try:
+        if index_path.stat().st_mtime < archive_dir.stat().st_mtime:
+            return None  # files changed since the index was written
+        return load_json(index_path)
+    except (OSError, ValueError):
+        return None
+
+
+def _build_archive_index(archive_dir: Path) -> dict[str, str]:
+    """Scan every archive file once and persist the video-ID index."""
+    index: dict[str, str] = {}
+    with os.scandir(archive_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".md") or not entry.is_file():
+                continue
+            try:
+                # The marker is plain ASCII, so search raw bytes via mmap
+                # instead of decoding the file
+                with open(entry.path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        match = _ARCHIVE_ID_RE.search(mm)
+                        if match:
+                            index[match.group(1).decode("utf-8")] = entry.name
+            except (OSError, ValueError):
+                # Unreadable or empty file — skip it
+                continue
+    try:
+        _ARCHIVE_INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        _archive_index_path(archive_dir).write_bytes(dump_json(index))
+    except OSError:
+        pass  # index is an optimization; the scan result is still valid
+    return index
 
 
 def check_archive_exists(original_video_id: str, logger: logging.Logger) -> bool:
-    """Check if archive already exists for this video."""
+    """Check if archive already exists for this video.
+
+    O(1) dict lookup against a persisted index; the full per-file scan only
+    runs when the archive directory changed since the index was built.
+    """
     archive_dir = WEB_REPO_PATH / "src" / "content" / "archive" / "ko"
     if not archive_dir.exists():
         return False
 
-    for existing_file in archive_dir.glob("*.md"):
-        try:
-            content = existing_file.read_text(encoding="utf-8")
-            if f'originalVideoId: "{original_video_id}"' in content:
-                logger.info(f"Archive for video {original_video_id} already exists: {existing_file}")
-                return True
-        except Exception:
-            continue
+    index = _load_archive_index(archive_dir)
+    if index is None:
+        index = _build_archive_index(archive_dir)
+
+    filename = index.get(original_video_id)
+    if filename:
+        logger.info(f"Archive for video {original_video_id} already exists: {archive_dir / filename}")
+        return True
     return False
 
 
-def step_add_to_web(
+async def step_add_to_web(
     out_dir: Path,
     original_video_id: str,
     logger: logging.Logger,
@@ -420,76 +711,113 @@ Web repo path: {WEB_REPO_PATH}
     logger.info("Calling Claude CLI...")
 
     try:
-        # Run Claude in print mode for non-interactive execution
-        proc = subprocess.run(
-            [
-                "claude",
-                "-p",  # Print mode (non-interactive)
-                "--allowedTools", "Read", "Write", "Edit", "Bash", "Glob", "Grep",
-                "--dangerously-skip-permissions",  # Allow file operations
-                prompt,
-            ],
-            capture_output=True,
-            text=True,
-            timeout=600,  # 10 minute timeout
+        # Run Claude in print mode for non-interactive execution; stdout is
+        # consumed as it arrives instead of buffering the whole tool-use
+        # session in memory
+        proc = await asyncio.create_subprocess_exec(
+            "claude",
+            "-p",  # Print mode (non-interactive)
+            "--allowedTools", "Read", "Write", "Edit", "Bash", "Glob", "Grep",
+            "--dangerously-skip-permissions",  # Allow file operations
+            prompt,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
             cwd=str(WEB_REPO_PATH),  # Run in web repo directory
         )
 
-        if proc.returncode != 0:
-            logger.error(f"Claude CLI failed: {proc.stderr}")
-            return None
-
-        output = proc.stdout
-        logger.info("Claude CLI completed")
-
-        # Try to extract PR URL from output
         pr_url = None
-        for line in output.split("\n"):
+
+        def scan_line(raw_line: bytes) -> None:
+            nonlocal pr_url
+            line = raw_line.decode("utf-8", errors="replace")
             if "github.com" in line and "/pull/" in line:
-                # Extract URL from line
-                import re
-                match = re.search(r'https://github\.com/[^\s]+/pull/\d+', line)
-                if match:
+                if match := _PR_URL_RE.search(line):
                     pr_url = match.group(0)
+
+        async def consume() -> None:
+            buf = bytearray()
+            while True:
+                chunk = await proc.stdout.read(65536)
+                if not chunk:
                     break
+                if pr_url:
+                    continue  # found — keep draining the pipe, stop scanning
+                buf += chunk
+                *complete, rest = buf.split(b"\n")
+                buf = bytearray(rest)
+                for raw_line in complete:
+                    scan_line(raw_line)
+                    if pr_url:
+                        break
+            if not pr_url and buf:
+                scan_line(bytes(buf))
+            await proc.wait()
+
+        try:
+            await asyncio.wait_for(consume(), timeout=600)  # 10 minute timeout
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error("Claude CLI timed out after 10 minutes")
+            return None
+
+        if proc.returncode != 0:
+            logger.error(f"Claude CLI failed with code {proc.returncode}")
+            return None
+
+        logger.info("Claude CLI completed")
 
         if pr_url:
             logger.info(f"Created PR: {pr_url}")
         else:
             logger.info("Claude completed but PR URL not found in output")
-            # Log full output for debugging
-            logger.debug(f"Claude output:\n{output}")
 
         return pr_url
 
-    except subprocess.TimeoutExpired:
-        logger.error("Claude CLI timed out after 10 minutes")
-        return None
     except Exception as e:
         logger.error(f"Failed to run Claude CLI: {e}")
         return None
 
 
-def main() -> None:
+def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Process YouTube video: subtitles, burn-in, markdown notes, upload, and add to web."
     )
     parser.add_argument("url", help="YouTube URL")
     parser.add_argument("--out-dir", type=Path, help="Override output directory")
     parser.add_argument("--keep-source", action="store_true", help="Keep source video file")
+    parser.add_argument(
+        "--prefetch-source",
+        action="store_true",
+        help="Download the source video once up front and share it with the subtitle/burn-in steps",
+    )
     parser.add_argument("--skip-burnin", action="store_true", help="Skip burn-in step")
     parser.add_argument("--skip-markdown", action="store_true", help="Skip markdown generation")
     parser.add_argument("--no-upload", action="store_true", help="Skip YouTube upload (default: upload)")
     parser.add_argument("--no-add-to-web", action="store_true", help="Skip adding to web archive (default: add to web)")
     parser.add_argument("--dry-run", action="store_true", help="Dry run (skip external API calls)")
-    args = parser.parse_args()
+    device_group = parser.add_mutually_exclusive_group()
+    device_group.add_argument("--gpu", action="store_true", help="Force GPU (CUDA) for whisper and burn-in encode")
+    device_group.add_argument("--cpu", action="store_true", help="Force CPU even if a GPU is available")
+    return parser
 
-    # Get video ID and setup directories
-    temp_logger = logging.getLogger("temp")
-    temp_logger.addHandler(logging.StreamHandler())
-    temp_logger.setLevel(logging.INFO)
 
-    video_id = get_video_id(args.url, temp_logger)
+async def process_url(args: argparse.Namespace) -> dict:
+    """Run the full pipeline for one URL; args as produced by build_arg_parser.
+
+    Callable in-process (see server/worker.py) as well as from the CLI.
+    Returns a summary dict: video_id, out_dir, upload_url, pr_url.
+    """
+    # Whisper transcription and the ffmpeg burn-in encode both run inside the
+    # skill scripts; the chosen device is handed to them via $YT_DEVICE
+    use_gpu = args.gpu or (not args.cpu and detect_gpu())
+    os.environ["YT_DEVICE"] = "cuda" if use_gpu else "cpu"
+
+    # Resolve the video ID to pick the output dir. For standard URLs this is
+    # the pure-regex fast path; the rare yt-dlp fallback runs before logging
+    # is configured, so it logs through the (still handler-less) pipeline
+    # logger and the ID is echoed again in the header below.
+    video_id = await get_video_id(args.url, logging.getLogger("process_video"))
     out_dir = args.out_dir or (VIDEOS_DIR / video_id)
     out_dir.mkdir(parents=True, exist_ok=True)
 
@@ -501,64 +829,86 @@ def main() -> None:
     logger.info(f"Processing: {args.url}")
     logger.info(f"Video ID: {video_id}")
     logger.info(f"Output directory: {out_dir}")
+    logger.info(f"Device: {os.environ['YT_DEVICE']}")
     logger.info("=" * 50)
 
     try:
         # Download metadata
         meta_path = out_dir / "meta.json"
         if not meta_path.exists():
-            meta = download_metadata(args.url, meta_path, logger)
+            meta = await download_metadata(args.url, meta_path, logger, video_id=video_id)
         else:
-            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            meta = load_json(meta_path)
             logger.info("Using existing metadata")
 
         title = meta.get("title", "Untitled")
-        description = meta.get("description", "")
+        # Derived once here; step_markdown takes it pre-truncated
+        description = (meta.get("description") or "")[:500]
+
+        # Step 0 (optional): fetch the source once so steps 1 & 2 don't each
+        # download it; the skills pick the path up from $YT_SOURCE_FILE
+        if args.prefetch_source:
+            source_path = await step_download(args.url, out_dir, logger, args.dry_run)
+            if source_path:
+                os.environ["YT_SOURCE_FILE"] = str(source_path)
 
         # Step 1: Subtitles
         ko_srt = out_dir / "ko.srt"
         en_srt = out_dir / "en.srt"
         if not ko_srt.exists() or not en_srt.exists():
-            step_subtitles(args.url, out_dir, logger, args.dry_run)
+            await step_subtitles(args.url, out_dir, logger, args.dry_run)
         else:
             logger.info(f"Using existing subtitles: {ko_srt}, {en_srt}")
 
-        # Step 2: Burn-in (+ optional upload via yt-burnin-upload skill)
+        # Steps 2 & 3 both consume ko.srt and write disjoint outputs, so the
+        # burn-in encode and markdown generation run concurrently
         upload_url = None
-        if not args.skip_burnin:
+
+        async def do_burnin() -> None:
+            """Step 2: Burn-in (+ optional upload via yt-burnin-upload skill)."""
+            nonlocal upload_url
             burnin_mp4 = out_dir / "burnin.mp4"
             upload_info_path = out_dir / "upload_info.json"
             do_upload = not args.no_upload
 
-            # Check if already uploaded
+            # Check if already uploaded; the parsed dict is kept so nothing
+            # downstream re-reads upload_info.json
             if upload_info_path.exists() and not args.dry_run:
-                upload_info = json.loads(upload_info_path.read_text(encoding="utf-8"))
+                upload_info = load_json(upload_info_path)
                 upload_url = upload_info.get("url")
                 if upload_url:
                     logger.info(f"Already uploaded: {upload_url}")
                     do_upload = False  # Skip upload, but still do burn-in if needed
 
             if not burnin_mp4.exists():
-                burnin_mp4, new_upload_url = step_burnin(
+                _, upload_info = await step_burnin(
                     args.url, ko_srt, en_srt, out_dir, logger, args.dry_run, upload=do_upload
                 )
-                if new_upload_url:
-                    upload_url = new_upload_url
+                if upload_info and upload_info.get("url"):
+                    upload_url = upload_info["url"]
             else:
                 logger.info(f"Using existing burn-in: {burnin_mp4}")
 
-        # Step 3: Markdown notes
-        if not args.skip_markdown:
+        async def do_markdown() -> None:
+            """Step 3: Markdown notes."""
             notes_md = out_dir / "notes.md"
             if not notes_md.exists():
-                step_markdown(ko_srt, out_dir, title, description, logger, args.dry_run)
+                await step_markdown(ko_srt, out_dir, title, description, meta, logger, args.dry_run)
             else:
                 logger.info(f"Using existing notes: {notes_md}")
 
+        steps = []
+        if not args.skip_burnin:
+            steps.append(do_burnin())
+        if not args.skip_markdown:
+            steps.append(do_markdown())
+        if steps:
+            await asyncio.gather(*steps)
+
         # Step 4: Add to web archive (default: enabled)
         pr_url = None
         if not args.no_add_to_web:
-            pr_url = step_add_to_web(out_dir, video_id, logger, args.dry_run)
+            pr_url = await step_add_to_web(out_dir, video_id, logger, args.dry_run)
 
         # Cleanup
         if not args.keep_source:
@@ -583,9 +933,17 @@ def main() -> None:
         if pr_url:
             print(f"PR: {pr_url}")
         print("\nGenerated files:")
-        for f in sorted(out_dir.iterdir()):
-            if f.is_file():
-                print(f"  - {f.name}")
+        with os.scandir(out_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.is_file():
+                    print(f"  - {entry.name}")
+
+        return {
+            "video_id": video_id,
+            "out_dir": str(out_dir),
+            "upload_url": upload_url,
+            "pr_url": pr_url,
+        }
 
     except Exception as e:
         logger.error(f"Processing failed: {e}", exc_info=True)
@@ -598,5 +956,9 @@ def main() -> None:
         raise
 
 
+async def main() -> None:
+    await process_url(build_arg_parser().parse_args())
+
+
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -12,9 +12,17 @@ class Settings(BaseSettings):
     api_host: str = "127.0.0.1"
     api_port: int = 32500
 
+    # Jobs
+    max_concurrent_jobs: int = 2  # videos processed at once; others queue
+    # Run jobs on a persistent worker pool instead of one subprocess per job.
+    # Faster for bulk ingestion (imports are paid once per worker) but gives
+    # up per-line log streaming and step progress.
+    use_worker_pool: bool = False
+
     # Paths
     videos_dir: Path = Path("/home/jonhpark/workspace/youtube-storage/videos")
     process_script: Path = Path("/home/jonhpark/workspace/youtube-storage/scripts/process_video.py")
+    jobs_db: Path = Path("/home/jonhpark/workspace/youtube-storage/config/jobs.db")
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "extra": "ignore"}
 
@@ -3,15 +3,42 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import re
 import subprocess
 import sys
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
+try:  # Optional fast JSON; falls back to stdlib json
+    import orjson
+except ImportError:
+    orjson = None
+
+from . import worker
 from .config import settings
+from .job_store import JobStore
+
+
+def _json_dumps(obj) -> str:
+    return orjson.dumps(obj).decode("utf-8") if orjson is not None else json.dumps(obj)
+
+
+def _json_loads(data: str | bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+# On-disk cache for yt-dlp URL → video-ID lookups, shared with
+# scripts/process_video.py (same location, same key scheme)
+YTMETA_CACHE_DIR = settings.videos_dir.parent / ".cache" / "ytmeta"
+YTMETA_CACHE_TTL = 86400  # 24 hours
+
+# yt-dlp's own cache (player JS, sig ciphers), shared with process_video.py
+YTDLP_CACHE_DIR = settings.videos_dir.parent / ".cache" / "yt-dlp"
 
 
 class JobStatus(str, Enum):
@@ -33,21 +60,134 @@ class Job:
     status: JobStatus = JobStatus.PENDING
     current_step: int = 0  # 0-4
     step_name: str = "Initializing"
-    started_at: datetime = field(default_factory=datetime.now)
-    completed_at: datetime | None = None
+    # Epoch seconds; formatted only at the API boundary (pydantic coerces
+    # floats to datetime in JobResponse)
+    started_at: float = field(default_factory=time.time)
+    completed_at: float | None = None
     result: dict | None = None
     error: str | None = None
-    logs: list[str] = field(default_factory=list)
+    # Ring buffer so long jobs can't grow memory without bound
+    logs: deque[str] = field(default_factory=lambda: deque(maxlen=2000))
+    # Total lines ever logged; logs holds the last len(logs) of them
+    log_count: int = 0
+    # Bounded queues feeding live SSE subscribers (None items signal state changes)
+    log_subscribers: list[asyncio.Queue] = field(default_factory=list, repr=False, compare=False)
 
 
-# In-memory job storage
+# Active (pending/running) jobs kept in memory for live event fan-out;
+# finished jobs live only in the SQLite store, so RSS stays bounded
 jobs: dict[str, Job] = {}
 
+store = JobStore(settings.jobs_db)
+# Reconcile rows orphaned by a previous process: nothing will ever resume
+# them, so without this they'd sit in listings as running forever and event
+# streams on them would keep-alive indefinitely
+store.fail_unfinished("server restarted")
+
+
+def _fanout(job: Job, item: tuple[int, str] | None) -> None:
+    """Push an item to every subscriber queue, dropping the oldest when full."""
+    for sub in job.log_subscribers:
+        try:
+            sub.put_nowait(item)
+        except asyncio.QueueFull:
+            try:
+                sub.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            sub.put_nowait(item)
+
+
+def notify_update(job: Job) -> None:
+    """Signal a state change to this job's SSE subscribers."""
+    _fanout(job, None)
+
+
+def _persist(job: Job) -> None:
+    """Write the job's current state through to the store."""
+    store.save(
+        {
+            "id": job.id,
+            "video_url": job.video_url,
+            "video_id": job.video_id,
+            "status": job.status.value,
+            "current_step": job.current_step,
+            "step_name": job.step_name,
+            "started_at": job.started_at,
+            "completed_at": job.completed_at,
+            "result_json": _json_dumps(job.result) if job.result is not None else None,
+            "error": job.error,
+        }
+    )
+
+
+def _job_from_row(row) -> Job:
+    """Rebuild a Job from its stored record (logs stay in the store)."""
+    return Job(
+        id=row["id"],
+        video_url=row["video_url"],
+        video_id=row["video_id"],
+        status=JobStatus(row["status"]),
+        current_step=row["current_step"],
+        step_name=row["step_name"],
+        started_at=row["started_at"],
+        completed_at=row["completed_at"],
+        result=_json_loads(row["result_json"]) if row["result_json"] else None,
+        error=row["error"],
+    )
+
+
+def _cache_path(key: str) -> Path:
+    return YTMETA_CACHE_DIR / hashlib.sha256(key.encode("utf-8")).hexdigest()[:24]
+
+
+def _cache_get(key: str) -> bytes | None:
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime < YTMETA_CACHE_TTL:
+            return path.read_bytes()
+    except OSError:
+        pass
+    return None
+
+
+def _cache_set(key: str, data: bytes) -> None:
+    YTMETA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _cache_path(key).write_bytes(data)
+
+
+def clear_ytmeta_cache() -> int:
+    """Drop all cached yt-dlp lookups. Returns the number of entries removed."""
+    removed = 0
+    if YTMETA_CACHE_DIR.exists():
+        for entry in YTMETA_CACHE_DIR.iterdir():
+            if entry.is_file():
+                entry.unlink()
+                removed += 1
+    return removed
+
+
+# Fast path for standard YouTube URL forms; unusual URLs fall back to yt-dlp
+_VIDEO_ID_RE = re.compile(r"(?:v=|youtu\.be/|/shorts/|/embed/|/live/)([0-9A-Za-z_-]{11})")
+
 
 def get_video_id_from_url(url: str) -> str:
-    """Extract video ID from YouTube URL using yt-dlp."""
+    """Extract video ID from YouTube URL.
+
+    Standard URL forms carry the 11-char ID verbatim and are parsed with a
+    regex; anything else (playlists, custom short-links) falls back to yt-dlp.
+    """
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return match.group(1)
+
+    cached = _cache_get(f"id:{url}")
+    if cached:
+        return cached.decode("utf-8")
+
     proc = subprocess.run(
-        ["yt-dlp", "--no-playlist", "--quiet", "--no-warnings", "--print", "%(id)s", "--skip-download", url],
+        ["yt-dlp", "--no-playlist", "--quiet", "--no-warnings", "--cache-dir", str(YTDLP_CACHE_DIR),
+         "--print", "%(id)s", "--skip-download", url],
         capture_output=True,
         text=True,
     )
@@ -56,6 +196,7 @@ def get_video_id_from_url(url: str) -> str:
     video_id = proc.stdout.strip().splitlines()[-1].strip()
     if not video_id:
         raise ValueError("Failed to extract video ID")
+    _cache_set(f"id:{url}", video_id.encode("utf-8"))
     return video_id
 
 
@@ -70,27 +211,100 @@ def create_job(video_url: str) -> Job:
         video_id=video_id,
     )
     jobs[job_id] = job
+    _persist(job)
     return job
 
 
+# Step headers are emitted by process_video.py as "Step N: ..." at line start;
+# streamed child output carries a "  | " prefix and won't match the anchor
+_STEP_RE = re.compile(r"^Step ([1-4]):", re.ASCII)
+
+_STEP_NAMES = {
+    1: "Generating subtitles",
+    2: "Burning in subtitles",
+    3: "Generating markdown",
+    4: "Adding to web archive",
+}
+
+# URL extraction, gated behind cheap substring checks in the consumer loop
+_UPLOAD_URL_RE = re.compile(r"https://[^\s]+youtube[^\s]+")
+_PR_URL_RE = re.compile(r"https://github\.com/[^\s]+/pull/\d+")
+
+
 def parse_step_from_line(line: str) -> tuple[int, str] | None:
     """Parse step number and name from log line."""
-    step_patterns = [
-        (1, r"Step 1.*subtitle", "Generating subtitles"),
-        (2, r"Step 2.*[Bb]urn", "Burning in subtitles"),
-        (3, r"Step 3.*[Mm]arkdown", "Generating markdown"),
-        (4, r"Step 4.*web|Claude", "Adding to web archive"),
-    ]
-    for step_num, pattern, step_name in step_patterns:
-        if re.search(pattern, line, re.IGNORECASE):
-            return step_num, step_name
+    match = _STEP_RE.match(line)
+    if match:
+        step_num = int(match.group(1))
+        return step_num, _STEP_NAMES[step_num]
     return None
 
 
+# Caps how many videos are processed at once; excess jobs wait as PENDING
+_job_semaphore = asyncio.Semaphore(settings.max_concurrent_jobs)
+
+
 async def run_job(job: Job) -> None:
-    """Run the video processing job asynchronously."""
+    """Run the video processing job asynchronously.
+
+    Waits on the concurrency semaphore first, so two ffmpeg/whisper pipelines
+    don't oversubscribe the machine and starve each other.
+    """
+    async with _job_semaphore:
+        if settings.use_worker_pool:
+            await _run_job_pooled(job)
+        else:
+            await _run_job(job)
+
+
+async def _run_job_pooled(job: Job) -> None:
+    """Run the pipeline on the persistent worker pool.
+
+    Skips the per-job interpreter startup of the subprocess path, at the cost
+    of log streaming and step progress: the pipeline runs to completion
+    inside the worker and only the final summary comes back.
+    """
     job.status = JobStatus.RUNNING
-    job.started_at = datetime.now()
+    job.started_at = time.time()
+    notify_update(job)
+    _persist(job)
+
+    try:
+        summary = await worker.run_in_pool(job.video_url)
+        job.status = JobStatus.COMPLETED
+        job.current_step = 4
+        job.step_name = "Completed"
+        job.result = {
+            "video_id": job.video_id,
+            "output_dir": summary.get("out_dir") or str(settings.videos_dir / job.video_id),
+            "upload_url": summary.get("upload_url"),
+            "pr_url": summary.get("pr_url"),
+        }
+    except Exception as e:
+        job.status = JobStatus.FAILED
+        job.error = str(e)
+
+    job.completed_at = time.time()
+    notify_update(job)
+    _persist(job)
+    jobs.pop(job.id, None)
+
+
+async def _run_job(job: Job) -> None:
+    job.status = JobStatus.RUNNING
+    job.started_at = time.time()
+    notify_update(job)
+    _persist(job)
+
+    log_seq = 0
+    log_buffer: list[str] = []
+
+    def flush_logs() -> None:
+        nonlocal log_seq
+        if log_buffer:
+            store.append_logs(job.id, log_seq, log_buffer)
+            log_seq += len(log_buffer)
+            log_buffer.clear()
 
     cmd = [
         sys.executable,
@@ -109,27 +323,53 @@ async def run_job(job: Job) -> None:
         upload_url = None
         pr_url = None
 
-        async for line in proc.stdout:
-            decoded = line.decode("utf-8").rstrip()
-            if decoded:
-                job.logs.append(decoded)
-
-                # Parse step progress
-                step_info = parse_step_from_line(decoded)
-                if step_info:
-                    job.current_step, job.step_name = step_info
-
-                # Extract upload URL
-                if "Uploaded:" in decoded:
-                    match = re.search(r"https://[^\s]+youtube[^\s]+", decoded)
-                    if match:
-                        upload_url = match.group(0)
-
-                # Extract PR URL
-                if "PR:" in decoded or "pull/" in decoded:
-                    match = re.search(r"https://github\.com/[^\s]+/pull/\d+", decoded)
-                    if match:
-                        pr_url = match.group(0)
+        def handle_line(raw_line: bytes) -> None:
+            nonlocal upload_url, pr_url
+            decoded = raw_line.decode("utf-8", errors="replace").rstrip()
+            if not decoded:
+                return
+            seq = job.log_count
+            job.logs.append(decoded)
+            job.log_count += 1
+            _fanout(job, (seq, decoded))
+
+            # Batch log lines into the store instead of a write per line
+            log_buffer.append(decoded)
+            if len(log_buffer) >= 100:
+                flush_logs()
+
+            # Parse step progress
+            step_info = parse_step_from_line(decoded)
+            if step_info and step_info != (job.current_step, job.step_name):
+                job.current_step, job.step_name = step_info
+                notify_update(job)
+                _persist(job)
+
+            # Extract upload URL
+            if "Uploaded:" in decoded:
+                match = _UPLOAD_URL_RE.search(decoded)
+                if match:
+                    upload_url = match.group(0)
+
+            # Extract PR URL
+            if "PR:" in decoded or "pull/" in decoded:
+                match = _PR_URL_RE.search(decoded)
+                if match:
+                    pr_url = match.group(0)
+
+        # Chunked reads keep the event loop free of per-line IO overhead
+        buf = bytearray()
+        while True:
+            chunk = await proc.stdout.read(65536)
+            if not chunk:
+                break
+            buf += chunk
+            *complete, rest = buf.split(b"\n")
+            buf = bytearray(rest)
+            for raw_line in complete:
+                handle_line(raw_line)
+        if buf:
+            handle_line(bytes(buf))
 
         await proc.wait()
 
@@ -151,16 +391,25 @@ async def run_job(job: Job) -> None:
         job.status = JobStatus.FAILED
         job.error = str(e)
 
-    job.completed_at = datetime.now()
+    job.completed_at = time.time()
+    notify_update(job)
 
-
-def get_job(job_id: str) -> Job | None:
-    """Get a job by ID."""
-    return jobs.get(job_id)
+    flush_logs()
+    _persist(job)
+    # Finished — drop the in-memory copy; reads now come from the store
+    jobs.pop(job.id, None)
 
 
-def list_jobs(status: JobStatus | None = None) -> list[Job]:
-    """List all jobs, optionally filtered by status."""
-    if status:
-        return [j for j in jobs.values() if j.status == status]
-    return list(jobs.values())
+def get_job(job_id: str) -> Job | None:
+    """Get a job by ID, preferring the live in-memory copy."""
+    job = jobs.get(job_id)
+    if job:
+        return job
+    row = store.get(job_id)
+    return _job_from_row(row) if row else None
+
+
+def list_jobs(status: JobStatus | None = None, limit: int | None = None) -> list[Job]:
+    """List jobs newest-first, optionally filtered by status and limited."""
+    rows = store.list(status.value if status else None, limit)
+    return [jobs.get(row["id"]) or _job_from_row(row) for row in rows]
@@ -0,0 +1,119 @@
+"""SQLite-backed persistence for processing jobs."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    video_url TEXT NOT NULL,
+    video_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    current_step INTEGER NOT NULL,
+    step_name TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    completed_at REAL,
+    result_json TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_started ON jobs (status, started_at DESC);
+CREATE TABLE IF NOT EXISTS job_logs (
+    job_id TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    line TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+class JobStore:
+    """Thin SQLite wrapper so job history survives restarts and RSS stays bounded.
+
+    Writes happen from the event loop and (potentially) other threads, so all
+    access goes through one connection guarded by a lock. WAL mode with
+    synchronous=NORMAL keeps the frequent small writes off the fsync path.
+    """
+
+    def __init__(self, db_path: Path):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+            self._conn.commit()
+
+    def save(self, row: dict) -> None:
+        """Insert or update a job record."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO jobs (id, video_url, video_id, status, current_step,
+                                  step_name, started_at, completed_at, result_json, error)
+                VALUES (:id, :video_url, :video_id, :status, :current_step,
+                        :step_name, :started_at, :completed_at, :result_json, :error)
+                ON CONFLICT(id) DO UPDATE SET
+                    status = excluded.status,
+                    current_step = excluded.current_step,
+                    step_name = excluded.step_name,
+                    started_at = excluded.started_at,
+                    completed_at = excluded.completed_at,
+                    result_json = excluded.result_json,
+                    error = excluded.error
+                """,
+                row,
+            )
+
+    def fail_unfinished(self, error: str) -> int:
+        """Mark all pending/running rows as failed. Returns the count updated.
+
+        Run at startup: a job left non-terminal in the store belongs to a
+        previous server process and can never make progress.
+        """
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE jobs SET status = 'failed', error = ?, completed_at = ?"
+                " WHERE status IN ('pending', 'running')",
+                (error, time.time()),
+            )
+            return cur.rowcount
+
+    def get(self, job_id: str) -> sqlite3.Row | None:
+        with self._lock:
+            cur = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+            return cur.fetchone()
+
+    def list(self, status: str | None = None, limit: int | None = None) -> list[sqlite3.Row]:
+        query = "SELECT * FROM jobs"
+        params: list = []
+        if status:
+            query += " WHERE status = ?"
+            params.append(status)
+        query += " ORDER BY started_at DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def append_logs(self, job_id: str, start_seq: int, lines: list[str]) -> None:
+        """Batch-insert log lines in a single transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO job_logs (job_id, seq, line) VALUES (?, ?, ?)",
+                [(job_id, start_seq + i, line) for i, line in enumerate(lines)],
+            )
+
+    def get_logs(self, job_id: str, after_seq: int = -1) -> list[sqlite3.Row]:
+        """Fetch log lines with seq greater than `after_seq`, in order."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seq, line FROM job_logs WHERE job_id = ? AND seq > ? ORDER BY seq",
+                (job_id, after_seq),
+            ).fetchall()
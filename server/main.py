@@ -3,18 +3,37 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+try:  # ORJSONResponse needs orjson; plain JSONResponse works without it
+    from fastapi.responses import ORJSONResponse
+
+    import orjson  # noqa: F401
+except ImportError:
+    ORJSONResponse = JSONResponse
+
 from .config import settings
-from .job_runner import Job, JobStatus, create_job, get_job, list_jobs, run_job
+from .job_runner import (
+    Job,
+    JobStatus,
+    clear_ytmeta_cache,
+    create_job,
+    get_job,
+    list_jobs,
+    run_job,
+    store,
+)
 
 app = FastAPI(
     title="YouTube Storage API",
     description="API for processing YouTube videos with subtitles, burn-in, and archiving",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -95,9 +114,94 @@ async def get_job_status(job_id: str):
     return JobResponse.from_job(job)
 
 
+@app.get("/api/jobs/{job_id}/events")
+async def stream_job_events(job_id: str, request: Request):
+    """Stream job state changes and log tails as Server-Sent Events.
+
+    `state` events carry the full job record and fire on every status or step
+    transition; `log` events carry one log line each, with the line's sequence
+    number as the SSE event id. Reconnecting clients can resume from where
+    they left off by sending `Last-Event-ID`; the missed tail is replayed from
+    the persisted job_logs table (finished jobs) or the in-memory backlog
+    (running jobs).
+    """
+    job = get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    last_event_id = request.headers.get("last-event-id", "")
+    after_seq = int(last_event_id) if last_event_id.isdigit() else -1
+
+    def state_frame() -> str:
+        return f"event: state\ndata: {JobResponse.from_job(job).model_dump_json()}\n\n"
+
+    def log_frame(seq: int, line: str) -> str:
+        return f"id: {seq}\nevent: log\ndata: {json.dumps(line, ensure_ascii=False)}\n\n"
+
+    async def event_generator():
+        yield state_frame()
+        last_state = (job.status, job.current_step, job.step_name)
+        last_seq = after_seq
+
+        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            # Finished job: replay the persisted log tail and stop
+            for row in store.get_logs(job_id, last_seq):
+                yield log_frame(row["seq"], row["line"])
+            return
+
+        # Subscribe before replaying the backlog so no line is missed;
+        # duplicates are filtered by sequence number
+        sub: asyncio.Queue = asyncio.Queue(maxsize=500)
+        job.log_subscribers.append(sub)
+        try:
+            backlog = list(job.logs)
+            start = job.log_count - len(backlog)
+            for i, line in enumerate(backlog):
+                seq = start + i
+                if seq > last_seq:
+                    yield log_frame(seq, line)
+                    last_seq = seq
+
+            while True:
+                try:
+                    item = await asyncio.wait_for(sub.get(), timeout=30.0)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                if item is None:  # state-change signal
+                    state = (job.status, job.current_step, job.step_name)
+                    if state != last_state:
+                        yield state_frame()
+                        last_state = state
+                    if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+                        break
+                else:
+                    seq, line = item
+                    if seq > last_seq:
+                        yield log_frame(seq, line)
+                        last_seq = seq
+        finally:
+            if sub in job.log_subscribers:
+                job.log_subscribers.remove(sub)
+
+    return StreamingResponse(event_generator(), media_type="text/event-stream")
+
+
 @app.get("/api/jobs", response_model=list[JobResponse])
-async def list_all_jobs(status: str | None = None):
-    """List all jobs, optionally filtered by status."""
+async def list_all_jobs(
+    status: str | None = None,
+    limit: int | None = None,
+    order: str | None = None,
+    fields: str | None = None,
+):
+    """List jobs, optionally filtered by status, sorted and limited server-side.
+
+    `order` accepts `started_at` or `-started_at` (descending). `limit` caps
+    the number of records returned after sorting. `fields` is a comma-separated
+    projection (e.g. `id,video_id,status`) that trims each record to just the
+    requested keys.
+    """
     job_status = None
     if status:
         try:
@@ -105,7 +209,40 @@ async def list_all_jobs(status: str | None = None):
         except ValueError:
             raise HTTPException(status_code=400, detail=f"Invalid status: {status}")
 
-    return [JobResponse.from_job(j) for j in list_jobs(job_status)]
+    if order and order.lstrip("-") != "started_at":
+        raise HTTPException(status_code=400, detail=f"Invalid order: {order}")
+    if limit is not None and limit < 0:
+        raise HTTPException(status_code=400, detail=f"Invalid limit: {limit}")
+
+    if order and not order.startswith("-"):
+        # Ascending is the rare path: the store returns newest-first, so the
+        # oldest N can't come from a pushed-down LIMIT
+        result = list_jobs(job_status)
+        result.reverse()
+        if limit is not None:
+            result = result[:limit]
+    else:
+        # Default and -started_at match the store's ORDER BY, so the store
+        # applies LIMIT and the response stays O(limit) as history grows
+        result = list_jobs(job_status, limit)
+
+    if fields:
+        include = {f.strip() for f in fields.split(",") if f.strip()}
+        unknown = include - set(JobResponse.model_fields)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Invalid fields: {', '.join(sorted(unknown))}")
+        return ORJSONResponse(
+            [JobResponse.from_job(j).model_dump(mode="json", include=include) for j in result]
+        )
+
+    return [JobResponse.from_job(j) for j in result]
+
+
+@app.delete("/api/cache")
+async def clear_cache():
+    """Invalidate the cached yt-dlp lookups (video IDs, metadata dumps)."""
+    removed = clear_ytmeta_cache()
+    return {"removed": removed}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,58 @@
+"""Long-lived worker pool that runs the pipeline in-process.
+
+Each worker imports process_video.py once at startup, so repeat jobs skip
+the per-job interpreter spin-up the subprocess path pays. Enabled via the
+`use_worker_pool` setting; the subprocess path in job_runner stays the
+default because it streams per-line progress, which the pool path cannot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+
+from .config import settings
+
+_pool: ProcessPoolExecutor | None = None
+
+# Set once per worker process by _preload
+_pipeline = None
+
+
+def _load_pipeline():
+    """Import process_video.py as a module (scripts/ is not a package)."""
+    spec = importlib.util.spec_from_file_location("process_video", str(settings.process_script))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _preload() -> None:
+    """Worker initializer: pay the import cost once, not once per job."""
+    global _pipeline
+    _pipeline = _load_pipeline()
+
+
+def _process_url(url: str) -> dict:
+    """Run one URL through the preloaded pipeline (executes in a worker)."""
+    global _pipeline
+    if _pipeline is None:  # initializer failed or pool misconfigured
+        _pipeline = _load_pipeline()
+    args = _pipeline.build_arg_parser().parse_args([url])
+    return asyncio.run(_pipeline.process_url(args))
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(
+            max_workers=settings.max_concurrent_jobs,
+            initializer=_preload,
+        )
+    return _pool
+
+
+async def run_in_pool(url: str) -> dict:
+    """Process a URL on the worker pool; returns the pipeline summary dict."""
+    return await asyncio.get_running_loop().run_in_executor(_get_pool(), _process_url, url)